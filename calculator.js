@@ -45,6 +45,9 @@ const inputs = {
   yearsToHold: document.getElementById("yearsToHold"),
 };
 
+// IRS Section 121 exemption cap (assumes married filing jointly)
+const PRIMARY_RESIDENCE_EXEMPTION_CAP = 500000;
+
 let chart = null;
 let currentYearlyData = null; // Store current data for tooltip access
 
@@ -58,18 +61,16 @@ function calculateMonthlyPayment(principal, annualRate, years) {
   }
   const monthlyRate = annualRate / 100 / 12;
   const numPayments = years * 12;
-  const factor = Math.pow(1 + monthlyRate, numPayments);
-  return principal * (monthlyRate * factor) / (factor - 1);
+  // growth = (1+r)^n - 1, computed without cancellation for small rates
+  const growth = Math.expm1(numPayments * Math.log1p(monthlyRate));
+  return principal * (monthlyRate * (growth + 1)) / growth;
 }
 
 /**
  * Update the displayed monthly payment
+ * Takes the already-parsed loan inputs from calculate() to avoid re-reading the DOM
  */
-function updateMonthlyPaymentDisplay() {
-  const loanAmount = parseFloat(inputs.originalLoanAmount.value) || 0;
-  const interestRate = parseFloat(inputs.interestRate.value) || 0;
-  const term = parseInt(inputs.mortgageTerm.value) || 30;
-  
+function updateMonthlyPaymentDisplay(loanAmount, interestRate, term) {
   const monthlyPayment = calculateMonthlyPayment(loanAmount, interestRate, term);
   inputs.monthlyPI.value = formatCurrency(monthlyPayment);
   
@@ -126,6 +127,8 @@ Object.values(inputs).forEach((input) => {
  * @param {number} monthlyRate - Monthly interest rate (annual rate / 12 / 100)
  * @param {number} totalMonths - Total loan term in months (typically 360 for 30-year)
  * @param {number} monthsPaid - Number of months already paid
+ * @param {number} [logGrowth] - Precomputed log1p(r); computed here if omitted
+ * @param {number} [totalGrowth] - Precomputed (1+r)^n - 1; computed here if omitted
  * @returns {number} Remaining balance
  */
 function calculateRemainingBalance(
@@ -133,6 +136,8 @@ function calculateRemainingBalance(
   monthlyRate,
   totalMonths,
   monthsPaid,
+  logGrowth = Math.log1p(monthlyRate),
+  totalGrowth = Math.expm1(totalMonths * logGrowth),
 ) {
   if (monthlyRate === 0) {
     // Edge case: 0% interest
@@ -142,42 +147,75 @@ function calculateRemainingBalance(
   // Standard amortization formula for remaining balance
   // B = P * [(1+r)^n - (1+r)^p] / [(1+r)^n - 1]
   // Where: P = principal, r = monthly rate, n = total months, p = months paid
-  const factor = Math.pow(1 + monthlyRate, totalMonths);
-  const paidFactor = Math.pow(1 + monthlyRate, monthsPaid);
+  // Subtracting 1 from numerator and denominator gives P * (Gn - Gp) / Gn with
+  // Gk = (1+r)^k - 1 = expm1(k * log1p(r)), which stays accurate for small r
+  const paidGrowth = Math.expm1(monthsPaid * logGrowth);
 
-  const balance = (principal * (factor - paidFactor)) / (factor - 1);
+  const balance = (principal * (totalGrowth - paidGrowth)) / totalGrowth;
   return Math.max(0, balance);
 }
 
+/**
+ * Build a table of compound growth multipliers
+ * @param {number} rate - Annual growth as a fraction (e.g. 0.03 for 3%)
+ * @param {number} length - Number of entries
+ * @returns {Float64Array} table[i] = (1 + rate)^i
+ */
+function buildGrowthTable(rate, length) {
+  const table = new Float64Array(length);
+  let multiplier = 1;
+  for (let i = 0; i < length; i++) {
+    table[i] = multiplier;
+    multiplier *= 1 + rate;
+  }
+  return table;
+}
+
+/**
+ * Convert a calendar year/month to a linear month index
+ * @param {number} year - Full year (e.g. 2022)
+ * @param {number} month - Month number, 1-12
+ * @returns {number} Linear month index (year * 12 + month); use differences only
+ */
+function dateToMonths(year, month) {
+  return year * 12 + month;
+}
+
 /**
  * Get months elapsed since loan origination
- * @param {string} originDateStr - Loan origination date string
+ * @param {string} originDateStr - Loan origination date string (YYYY-MM-DD)
  * @returns {number} Months elapsed (payments made)
  * Note: First payment is typically ~45 days after origination (skips a month)
  * e.g., Loan originated 7/19/2022, first payment 9/1/2022
  */
 function getMonthsElapsed(originDateStr) {
-  const originDate = new Date(originDateStr);
+  // Read year/month straight from the string: only whole months matter, and
+  // new Date("YYYY-MM-DD") parses as UTC, which can shift the local month
+  const [originYear, originMonth] = originDateStr.split("-").map(Number);
   const now = new Date();
   const months =
-    (now.getFullYear() - originDate.getFullYear()) * 12 +
-    (now.getMonth() - originDate.getMonth());
+    dateToMonths(now.getFullYear(), now.getMonth() + 1) -
+    dateToMonths(originYear, originMonth);
   // Subtract 1 because first payment skips a month after origination
   return Math.max(0, months - 1);
 }
 
+// Shared currency formatter (constructing Intl.NumberFormat is expensive,
+// and formatCurrency runs for every table cell, tooltip and axis tick)
+const currencyFormatter = new Intl.NumberFormat("en-US", {
+  style: "currency",
+  currency: "USD",
+  minimumFractionDigits: 0,
+  maximumFractionDigits: 0,
+});
+
 /**
  * Format number as currency
  * @param {number} value
  * @returns {string}
  */
 function formatCurrency(value) {
-  return new Intl.NumberFormat("en-US", {
-    style: "currency",
-    currency: "USD",
-    minimumFractionDigits: 0,
-    maximumFractionDigits: 0,
-  }).format(value);
+  return currencyFormatter.format(value);
 }
 
 /**
@@ -223,11 +261,13 @@ function validateInputs() {
   clampInput(inputs.investmentReturn, -50, 50);
   clampInput(inputs.yearsToHold, 1, 30, true);
 
-  // Validate loan origination date: must be a valid date not in the future
+  // Validate loan origination date: must be a valid YYYY-MM-DD date (the
+  // format getMonthsElapsed reads) not in the future
   const dateVal = inputs.loanOriginDate.value;
   const parsed = new Date(dateVal);
-  if (!dateVal || isNaN(parsed.getTime()) || parsed > new Date()) {
-    inputs.loanOriginDate.value = new Date().toISOString().split("T")[0];
+  const now = new Date();
+  if (!/^\d{4}-\d{2}-\d{2}$/.test(dateVal) || isNaN(parsed.getTime()) || parsed > now) {
+    inputs.loanOriginDate.value = now.toISOString().split("T")[0];
   }
 }
 
@@ -238,41 +278,115 @@ function calculate() {
   // Validate all inputs first (silent clamping)
   validateInputs();
 
-  // Update the displayed monthly payment first
-  const monthlyPI = updateMonthlyPaymentDisplay();
-  
-  // Get all input values (now guaranteed to be valid after validation)
-  const purchasePrice = parseFloat(inputs.purchasePrice.value) || 0;
-  const loanOriginDate = inputs.loanOriginDate.value;
-  const originalLoanAmount = parseFloat(inputs.originalLoanAmount.value) || 0;
-  const interestRate = parseFloat(inputs.interestRate.value) || 0;
-  const mortgageTerm = parseInt(inputs.mortgageTerm.value) || 30;
-  const currentHomeValue = parseFloat(inputs.currentHomeValue.value) || 0;
-  const monthlyHOA = parseFloat(inputs.monthlyHOA.value) || 0;
-  const monthlyTaxes = parseFloat(inputs.monthlyTaxes.value) || 0;
-  const monthlyInsurance = parseFloat(inputs.monthlyInsurance.value) || 0;
-  const monthlyMaintenance = parseFloat(inputs.monthlyMaintenance.value) || 0;
-  const rentalPrice = parseFloat(inputs.rentalPrice.value) || 0;
-  const annualRentIncrease = parseFloat(inputs.annualRentIncrease.value) || 0;
-  const propertyMgmtFee = parseFloat(inputs.propertyMgmtFee.value) || 0;
-  const rentalTaxRate = parseFloat(inputs.rentalTaxRate.value) || 0;
-  const homeAppreciation = parseFloat(inputs.homeAppreciation.value) || 0;
-  const costInflation = parseFloat(inputs.costInflation.value) || 0;
-  const sellingFees = parseFloat(inputs.sellingFees.value) || 0;
-  const capitalGainsTax = parseFloat(inputs.capitalGainsTax.value) || 0;
-  const investmentReturn = parseFloat(inputs.investmentReturn.value) || 0;
-  const yearsToHold = parseInt(inputs.yearsToHold.value) || 10;
-  const isPrimaryResidence = inputs.primaryResidence.value === "yes";
+  const config = readInputs();
+
+  // Update the displayed monthly payment
+  const monthlyPI = updateMonthlyPaymentDisplay(
+    config.originalLoanAmount,
+    config.interestRate,
+    config.mortgageTerm,
+  );
+
+  const yearlyData = projectYears(config, monthlyPI);
+
+  // Update UI
+  updateChart(yearlyData);
+  updateTable(yearlyData);
+  updateSummary(yearlyData);
+
+  // Persist current inputs to URL
+  saveToURL();
+}
+
+/**
+ * Read all input values into a frozen scenario config.
+ * @returns {Readonly<Object>} Parsed inputs (valid after validateInputs())
+ */
+function readInputs() {
+  return Object.freeze({
+    purchasePrice: parseFloat(inputs.purchasePrice.value) || 0,
+    originalLoanAmount: parseFloat(inputs.originalLoanAmount.value) || 0,
+    interestRate: parseFloat(inputs.interestRate.value) || 0,
+    mortgageTerm: parseInt(inputs.mortgageTerm.value) || 30,
+    monthsElapsed: getMonthsElapsed(inputs.loanOriginDate.value),
+    currentHomeValue: parseFloat(inputs.currentHomeValue.value) || 0,
+    monthlyHOA: parseFloat(inputs.monthlyHOA.value) || 0,
+    monthlyTaxes: parseFloat(inputs.monthlyTaxes.value) || 0,
+    monthlyInsurance: parseFloat(inputs.monthlyInsurance.value) || 0,
+    monthlyMaintenance: parseFloat(inputs.monthlyMaintenance.value) || 0,
+    rentalPrice: parseFloat(inputs.rentalPrice.value) || 0,
+    annualRentIncrease: parseFloat(inputs.annualRentIncrease.value) || 0,
+    propertyMgmtFee: parseFloat(inputs.propertyMgmtFee.value) || 0,
+    rentalTaxRate: parseFloat(inputs.rentalTaxRate.value) || 0,
+    homeAppreciation: parseFloat(inputs.homeAppreciation.value) || 0,
+    costInflation: parseFloat(inputs.costInflation.value) || 0,
+    sellingFees: parseFloat(inputs.sellingFees.value) || 0,
+    capitalGainsTax: parseFloat(inputs.capitalGainsTax.value) || 0,
+    investmentReturn: parseFloat(inputs.investmentReturn.value) || 0,
+    yearsToHold: parseInt(inputs.yearsToHold.value) || 10,
+    isPrimaryResidence: inputs.primaryResidence.value === "yes",
+  });
+}
+
+/**
+ * Project both scenarios year by year.
+ * Pure numeric kernel: no DOM access.
+ * @param {Readonly<Object>} config - Scenario inputs from readInputs()
+ * @param {number} monthlyPI - Fixed monthly principal & interest payment
+ * @returns {Object[]} One entry per year, 0..yearsToHold
+ */
+function projectYears(config, monthlyPI) {
+  const {
+    purchasePrice,
+    originalLoanAmount,
+    interestRate,
+    mortgageTerm,
+    monthsElapsed,
+    currentHomeValue,
+    monthlyHOA,
+    monthlyTaxes,
+    monthlyInsurance,
+    monthlyMaintenance,
+    rentalPrice,
+    annualRentIncrease,
+    propertyMgmtFee,
+    rentalTaxRate,
+    homeAppreciation,
+    costInflation,
+    sellingFees,
+    capitalGainsTax,
+    investmentReturn,
+    yearsToHold,
+    isPrimaryResidence,
+  } = config;
 
   // Derived values
   const monthlyRate = interestRate / 100 / 12;
   const totalLoanMonths = mortgageTerm * 12; // Use selected mortgage term
-  const monthsElapsed = getMonthsElapsed(loanOriginDate);
+  const logGrowth = Math.log1p(monthlyRate);
+  const amortizationGrowth = Math.expm1(totalLoanMonths * logGrowth);
 
   // Monthly PITI (P&I is fixed, but taxes/insurance inflate over time)
   // We'll calculate year-specific costs in the loop
 
-// Results storage
+  const numYears = yearsToHold + 1;
+  const appreciationGrowth = buildGrowthTable(homeAppreciation / 100, numYears);
+  const rentGrowth = buildGrowthTable(annualRentIncrease / 100, numYears);
+  const inflationGrowth = buildGrowthTable(costInflation / 100, numYears);
+  const returnGrowth = buildGrowthTable(investmentReturn / 100, numYears);
+
+  const mgmtFeeRate = propertyMgmtFee / 100;
+  const rentalTaxFraction = rentalTaxRate / 100;
+  const sellingFeeRate = sellingFees / 100;
+  const capitalGainsRate = capitalGainsTax / 100;
+
+  // Capital gains tax exemption for primary residence (IRS Section 121)
+  // - Must have lived in home 2 of last 5 years to qualify
+  // - Exemption is $250k single / $500k married filing jointly
+  // - We use year <= 3 as proxy for "still qualifies" and assume MFJ ($500k cap)
+  const lastExemptYear = isPrimaryResidence ? 3 : -1;
+
+  // Results storage
   const yearlyData = [];
 
   // Cumulative tracking for rental scenario
@@ -285,8 +399,7 @@ function calculate() {
 
     // --- PROPERTY VALUES ---
     // Home value: Year 0 uses user-provided current value, future years apply appreciation
-    const homeValue =
-      currentHomeValue * Math.pow(1 + homeAppreciation / 100, year);
+    const homeValue = currentHomeValue * appreciationGrowth[year];
 
     // Loan balance at this year
     const loanBalance = calculateRemainingBalance(
@@ -294,6 +407,8 @@ function calculate() {
       monthlyRate,
       totalLoanMonths,
       futureMonthsElapsed,
+      logGrowth,
+      amortizationGrowth,
     );
 
     // Equity
@@ -302,17 +417,15 @@ function calculate() {
     // --- RENTAL SCENARIO (for this specific year) ---
     // Rent at this year (with annual increases from now)
     // Delay rent increase by 1 year (Year 1 is same as input rent, Year 2 is +increase)
-    const rentGrowthExponent = Math.max(0, year - 1);
-    const currentRent =
-      rentalPrice * Math.pow(1 + annualRentIncrease / 100, rentGrowthExponent);
+    const currentRent = rentalPrice * rentGrowth[Math.max(0, year - 1)];
     const annualRentalIncome = currentRent * 12;
 
     // Property management fee
-    const annualMgmtFee = annualRentalIncome * (propertyMgmtFee / 100);
+    const annualMgmtFee = annualRentalIncome * mgmtFeeRate;
 
     // Annual expenses with inflation applied to non-fixed costs
     // P&I payment is fixed, but taxes, insurance, HOA, and maintenance inflate
-    const inflationFactor = Math.pow(1 + costInflation / 100, year);
+    const inflationFactor = inflationGrowth[year];
     const inflatedTaxes = monthlyTaxes * inflationFactor;
     const inflatedInsurance = monthlyInsurance * inflationFactor;
     const inflatedHOA = monthlyHOA * inflationFactor;
@@ -326,7 +439,7 @@ function calculate() {
 
     // Tax on rental profit (only if positive)
     const rentalTax =
-      grossRentalProfit > 0 ? grossRentalProfit * (rentalTaxRate / 100) : 0;
+      grossRentalProfit > 0 ? grossRentalProfit * rentalTaxFraction : 0;
 
     // Net cash flow from rental this year
     const netRentalCashFlow = grossRentalProfit - rentalTax;
@@ -340,7 +453,7 @@ function calculate() {
 
     // --- SALE SCENARIO ---
     // Selling costs (Removed prep costs per user request)
-    const sellingCosts = homeValue * (sellingFees / 100);
+    const sellingCosts = homeValue * sellingFeeRate;
 
     // Net proceeds before capital gains
     const netSaleProceeds = homeValue - loanBalance - sellingCosts;
@@ -348,40 +461,18 @@ function calculate() {
     // Capital gains calculation
     const capitalGain = homeValue - purchasePrice; // Simplified: not accounting for improvements
 
-    // Capital gains tax exemption for primary residence (IRS Section 121)
-    // - Must have lived in home 2 of last 5 years to qualify
-    // - Exemption is $250k single / $500k married filing jointly
-    // - We use year <= 3 as proxy for "still qualifies" and assume MFJ ($500k cap)
-    let capitalGainsTaxOwed = 0;
-    
+    // Primary Residence Exclusion applies (up to the cap) while still qualifying;
+    // otherwise the full gain is taxed. A loss is never taxed.
+    const exemption = year <= lastExemptYear ? PRIMARY_RESIDENCE_EXEMPTION_CAP : 0;
+    const taxableGain = Math.max(0, capitalGain - exemption);
+
     // Check if underwater on the sale transaction itself
+    // (no cash to pay taxes, simplified assumption)
     const isUnderwater = netSaleProceeds < 0;
-    // IRS exemption cap (assumes married filing jointly)
-    const PRIMARY_RESIDENCE_EXEMPTION_CAP = 500000;
-
-    if (capitalGain > 0) {
-      if (isUnderwater) {
-        // No cash to pay taxes, simplified assumption
-        capitalGainsTaxOwed = 0;
-      } else if (isPrimaryResidence && year <= 3) {
-        // Primary Residence Exclusion applies, but only up to the cap
-        const taxableGain = Math.max(0, capitalGain - PRIMARY_RESIDENCE_EXEMPTION_CAP);
-        capitalGainsTaxOwed = taxableGain * (capitalGainsTax / 100);
-      } else {
-        // No exemption - tax the full gain
-        capitalGainsTaxOwed = capitalGain * (capitalGainsTax / 100);
-      }
-    }
+    const capitalGainsTaxOwed = isUnderwater ? 0 : taxableGain * capitalGainsRate;
     // Net after-tax sale proceeds
     const netAfterTaxProceeds = netSaleProceeds - capitalGainsTaxOwed;
 
-    // If we sell now and invest the proceeds, how much do we have at end of analysis period?
-    // Only apply investment growth if proceeds are positive (can't invest a loss)
-    const yearsToInvest = yearsToHold - year;
-    const investedValue = netAfterTaxProceeds > 0
-      ? netAfterTaxProceeds * Math.pow(1 + investmentReturn / 100, yearsToInvest)
-      : netAfterTaxProceeds; // Keep the loss as-is, no "growth"
-
     // Capture Year 0 Baseline for Chart Comparison
     if (year === 0) {
         sellYear0Baseline = netAfterTaxProceeds;
@@ -391,7 +482,7 @@ function calculate() {
     // User Rule: If Year 0 Proceeds (Baseline) is positive, grow it by investment return.
     // If negative, show that negative value forever (no growth/debt interest).
     const sellYear0Total = sellYear0Baseline > 0 
-        ? sellYear0Baseline * Math.pow(1 + investmentReturn / 100, year) 
+        ? sellYear0Baseline * returnGrowth[year] 
         : sellYear0Baseline;
 
     // Simple Net Worth (Net Proceeds + Actual Cash Flow) - requested by user for table
@@ -402,13 +493,6 @@ function calculate() {
         simpleRentalNetWorth = 0;
     }
 
-    // For the SELL scenario, we want to compare apples to apples
-    // The "sell now" value should show what you'd have at the END of the analysis period
-    // if you sold at year X and invested the proceeds
-
-    // Also need to account for positive rental cash flow that could have been invested
-    // if you chose to rent for these years first then sell
-
     // Store year data (only properties used by live UI code)
     yearlyData.push({
       year,
@@ -433,13 +517,7 @@ function calculate() {
     });
   }
 
-  // Update UI
-  updateChart(yearlyData);
-  updateTable(yearlyData);
-  updateSummary(yearlyData);
-
-  // Persist current inputs to URL
-  saveToURL();
+  return yearlyData;
 }
 
 /**
@@ -559,12 +637,28 @@ function createCell(text, className) {
   return td;
 }
 
+// Results table data columns, in display order (after the Year column).
+// `signed` columns are colored positive/negative.
+const TABLE_COLUMNS = [
+  { key: "homeValue" },
+  { key: "loanBalance" },
+  { key: "equity" },
+  { key: "sellingCosts" },
+  { key: "capitalGainsTaxOwed" },
+  { key: "netAfterTaxProceeds", signed: true },
+  { key: "netRentalCashFlow", signed: true },
+  { key: "cumulativeRentalCashFlow", signed: true },
+  { key: "simpleRentalNetWorth", signed: true },
+  { key: "sellYear0Total", signed: true },
+];
+
 /**
  * Update the results table using DOM API (safer than innerHTML)
+ * Rows are built in a detached fragment and swapped in with one DOM write
  */
 function updateTable(data) {
   const tbody = document.querySelector("#resultsTable tbody");
-  tbody.innerHTML = "";
+  const fragment = document.createDocumentFragment();
 
   data.forEach((d) => {
     const row = document.createElement("tr");
@@ -578,19 +672,16 @@ function updateTable(data) {
     row.appendChild(yearCell);
 
     // Data columns
-    row.appendChild(createCell(formatCurrency(d.homeValue)));
-    row.appendChild(createCell(formatCurrency(d.loanBalance)));
-    row.appendChild(createCell(formatCurrency(d.equity)));
-    row.appendChild(createCell(formatCurrency(d.sellingCosts)));
-    row.appendChild(createCell(formatCurrency(d.capitalGainsTaxOwed)));
-    row.appendChild(createCell(formatCurrency(d.netAfterTaxProceeds), d.netAfterTaxProceeds >= 0 ? "positive" : "negative"));
-    row.appendChild(createCell(formatCurrency(d.netRentalCashFlow), d.netRentalCashFlow >= 0 ? "positive" : "negative"));
-    row.appendChild(createCell(formatCurrency(d.cumulativeRentalCashFlow), d.cumulativeRentalCashFlow >= 0 ? "positive" : "negative"));
-    row.appendChild(createCell(formatCurrency(d.simpleRentalNetWorth), d.simpleRentalNetWorth >= 0 ? "positive" : "negative"));
-    row.appendChild(createCell(formatCurrency(d.sellYear0Total), d.sellYear0Total >= 0 ? "positive" : "negative"));
-
-    tbody.appendChild(row);
+    TABLE_COLUMNS.forEach(({ key, signed }) => {
+      const value = d[key];
+      const className = signed ? (value >= 0 ? "positive" : "negative") : undefined;
+      row.appendChild(createCell(formatCurrency(value), className));
+    });
+
+    fragment.appendChild(row);
   });
+
+  tbody.replaceChildren(fragment);
 }
 
 /**